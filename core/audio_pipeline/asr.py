@@ -0,0 +1,33 @@
+from loguru import logger
+
+import threading
+
+DEFAULT_WHISPER_MODEL_PATH = 'models/models--Systran--faster-whisper-small/snapshots/536b0662742c02347bc0e980a01041f333bce120'
+
+_whisper_models = {}
+_whisper_lock = threading.Lock()
+
+
+def get_whisper_model(model_size_or_path=DEFAULT_WHISPER_MODEL_PATH, device="cpu", compute_type="float32"):
+    """Load the faster-whisper model once per process, even when called from several threads."""
+    key = (model_size_or_path, device, compute_type)
+    model = _whisper_models.get(key)
+    if model is None:
+        with _whisper_lock:
+            model = _whisper_models.get(key)
+            if model is None:
+                model = _whisper_models[key] = _load_whisper_model(*key)
+    return model
+
+
+def _load_whisper_model(model_size_or_path, device, compute_type):
+    from faster_whisper import WhisperModel
+
+    logger.info(f"Loading Whisper model: {model_size_or_path}")
+    return WhisperModel(
+        model_size_or_path=model_size_or_path,
+        device=device,
+        compute_type=compute_type,
+        download_root="models",
+        local_files_only=True
+    )
@@ -0,0 +1,238 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from loguru import logger
+
+import mmap
+import os
+import struct
+import sys
+
+# On-disk layout (little-endian, every section 8-byte aligned):
+#   header           magic, version, n_segments, n_words, text_nbytes
+#   seg_start        float64[n_segments]
+#   seg_end          float64[n_segments]
+#   seg_end_max      float64[n_segments]      running maximum of seg_end
+#   seg_text_off     uint64[n_segments + 1]   byte offsets into the text buffer
+#   seg_word_off     uint64[n_segments + 1]   index range of each segment's words
+#   word_start       float64[n_words]
+#   word_end         float64[n_words]
+#   word_end_max     float64[n_words]         running maximum of word_end
+#   word_text_off    uint64[n_words + 1]      byte offsets into the text buffer
+#   text             utf-8 bytes, segment texts followed by word texts
+# Columns are read in place through memoryview casts, which use the host byte
+# order, so both reading and writing are refused on big-endian hosts.
+# Start times must be non-decreasing; end times may go backwards slightly (as
+# faster-whisper produces with VAD), so time lookups bisect the running maximum.
+MAGIC = b"VTS1"
+VERSION = 2
+_HEADER = struct.Struct("<4sIQQQ")
+
+Segment = namedtuple("Segment", ["start", "end", "text"])
+Word = namedtuple("Word", ["start", "end", "text"])
+
+
+def parse_timestamp(value):
+    """Convert "SS", "MM:SS" or "HH:MM:SS(.ms)" (or a number) to seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    seconds = 0.0
+    for part in value.strip().split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def _check_byteorder():
+    if sys.byteorder != "little":
+        raise ValueError("TranscriptStore files are only supported on little-endian hosts")
+
+
+def _running_max(values):
+    result, current = array("d"), float("-inf")
+    for value in values:
+        current = max(current, value)
+        result.append(current)
+    return result
+
+
+def _check_sorted(values, name):
+    for prev, cur in zip(values, values[1:]):
+        if cur < prev:
+            raise ValueError(f"{name} must be non-decreasing, got {cur} after {prev}")
+
+
+class TranscriptStore:
+    """Memory-mapped columnar transcript with segment and word timestamps."""
+
+    def __init__(self, path):
+        _check_byteorder()
+        self.path = path
+        self._file = None
+        self._mmap = None
+        try:
+            self._file = open(path, "rb")
+            if os.fstat(self._file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"Not a transcript store file: {path}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+            self._map_columns()
+        except BaseException:
+            self.close()
+            raise
+
+    def _map_columns(self):
+        magic, version, n_segments, n_words, text_nbytes = _HEADER.unpack_from(self._view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a transcript store file: {self.path}")
+        expected = _HEADER.size + 8 * (5 * n_segments + 2 + 4 * n_words + 1) + text_nbytes
+        if expected != len(self._mmap):
+            raise ValueError(
+                f"Corrupt transcript store {self.path}: expected {expected} bytes, found {len(self._mmap)}"
+            )
+        self.n_segments = n_segments
+        self.n_words = n_words
+
+        offset = _HEADER.size
+
+        def column(fmt, length):
+            nonlocal offset
+            col = self._view[offset:offset + 8 * length].cast(fmt)
+            offset += 8 * length
+            return col
+
+        self._seg_start = column("d", n_segments)
+        self._seg_end = column("d", n_segments)
+        self._seg_end_max = column("d", n_segments)
+        self._seg_text_off = column("Q", n_segments + 1)
+        self._seg_word_off = column("Q", n_segments + 1)
+        self._word_start = column("d", n_words)
+        self._word_end = column("d", n_words)
+        self._word_end_max = column("d", n_words)
+        self._word_text_off = column("Q", n_words + 1)
+        self._text = self._view[offset:offset + text_nbytes]
+
+    @classmethod
+    def open(cls, path):
+        return cls(path)
+
+    @staticmethod
+    def write(path, segments):
+        """Write faster-whisper style segments (``start``, ``end``, ``text``, ``words``) to `path`."""
+        _check_byteorder()
+        seg_start, seg_end = array("d"), array("d")
+        seg_text_off, seg_word_off = array("Q", [0]), array("Q", [0])
+        word_start, word_end, word_texts = array("d"), array("d"), []
+        text = bytearray()
+
+        for segment in segments:
+            seg_start.append(segment.start)
+            seg_end.append(segment.end)
+            text += segment.text.encode("utf-8")
+            seg_text_off.append(len(text))
+            for word in getattr(segment, "words", None) or []:
+                word_start.append(word.start)
+                word_end.append(word.end)
+                word_texts.append(word.word.encode("utf-8"))
+            seg_word_off.append(len(word_start))
+
+        _check_sorted(seg_start, "Segment start times")
+        _check_sorted(word_start, "Word start times")
+
+        word_text_off = array("Q", [len(text)])
+        for word_text in word_texts:
+            text += word_text
+            word_text_off.append(len(text))
+
+        columns = [
+            seg_start, seg_end, _running_max(seg_end), seg_text_off, seg_word_off,
+            word_start, word_end, _running_max(word_end), word_text_off,
+        ]
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(seg_start), len(word_start), len(text)))
+            for col in columns:
+                f.write(col.tobytes())
+            f.write(text)
+        os.replace(tmp_path, path)
+        logger.info(f"Wrote {len(seg_start)} segments and {len(word_start)} words to {path}")
+        return path
+
+    def close(self):
+        for name in ("_seg_start", "_seg_end", "_seg_end_max", "_seg_text_off", "_seg_word_off",
+                     "_word_start", "_word_end", "_word_end_max", "_word_text_off", "_text", "_view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.n_segments
+
+    def _decode(self, begin, end):
+        return bytes(self._text[begin:end]).decode("utf-8")
+
+    def segment(self, i):
+        return Segment(
+            self._seg_start[i],
+            self._seg_end[i],
+            self._decode(self._seg_text_off[i], self._seg_text_off[i + 1]),
+        )
+
+    def word(self, i):
+        return Word(
+            self._word_start[i],
+            self._word_end[i],
+            self._decode(self._word_text_off[i], self._word_text_off[i + 1]),
+        )
+
+    def words_of_segment(self, i):
+        return [self.word(j) for j in range(self._seg_word_off[i], self._seg_word_off[i + 1])]
+
+    def _range(self, starts, ends_max, start, end):
+        """Index range that can contain entries overlapping the closed interval [start, end].
+
+        The first index always overlaps; later ones may end before `start` when end
+        times go backwards, so callers filter on the entry's own end time.
+        """
+        start, end = parse_timestamp(start), parse_timestamp(end)
+        if start > end:
+            raise ValueError(f"Start time {start} is after end time {end}")
+        return start, bisect_left(ends_max, start), bisect_right(starts, end)
+
+    def segments_between(self, start, end):
+        start, first, last = self._range(self._seg_start, self._seg_end_max, start, end)
+        return [self.segment(i) for i in range(first, last) if self._seg_end[i] >= start]
+
+    def words_between(self, start, end):
+        start, first, last = self._range(self._word_start, self._word_end_max, start, end)
+        return [self.word(i) for i in range(first, last) if self._word_end[i] >= start]
+
+    def text_between(self, start, end):
+        """Text of the segments overlapping [start, end], e.g. ``text_between("12:30", "14:00")``.
+
+        Segments are one per line, as in `full_text`.
+        """
+        return "".join(f"{segment.text}\n" for segment in self.segments_between(start, end))
+
+    def words_around(self, start, end, context=10):
+        """Words overlapping [start, end] plus `context` words on either side."""
+        _, first, last = self._range(self._word_start, self._word_end_max, start, end)
+        first, last = max(first - context, 0), min(last + context, self.n_words)
+        return [self.word(i) for i in range(first, last)]
+
+    def full_text(self):
+        """Segment texts one per line, matching the plain-text transcript files."""
+        return "".join(f"{self.segment(i).text}\n" for i in range(self.n_segments))
@@ -1,43 +1,57 @@
-import weaviate
 import os
 import warnings
 warnings.filterwarnings("ignore", category=SyntaxWarning)
 
-from langchain_huggingface.embeddings import HuggingFaceEmbeddings
-from langchain_groq import ChatGroq
-from langchain.memory import ConversationBufferMemory
-from langchain.chains import conversational_retrieval, retrieval_qa
-from langchain.agents import initialize_agent
-from langchain_core.prompts import (
-    ChatPromptTemplate,
-    MessagesPlaceholder,
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate
-)
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
-from langchain_core.documents import Document
-from langchain_core.tools import tool
-
-from langchain_community.document_loaders import TextLoader
-from langchain_weaviate.vectorstores import WeaviateVectorStore
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-
-from contextlib import contextmanager
+from functools import lru_cache
 from loguru import logger
-from pyvi import ViTokenizer
-from weaviate.classes.init import Auth
-from dotenv import load_dotenv
 
-load_dotenv()
+import threading
 
-weaviate_url = os.getenv('WEAVIATE_URL')
-weaviate_api_key = os.getenv('WEAVIATE_API_KEY')
-os.environ["GROQ_API_KEY"] = os.getenv("GROQ_API_KEY")
+# Heavy dependencies (langchain, weaviate, groq, pyvi, HuggingFace) are imported
+# inside the functions that use them so importing this module stays cheap.
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-mpnet-base-v2"
+
+_embedding_models = {}
+_embedding_lock = threading.Lock()
+
+
+def load_config():
+    """Load environment variables and return the Weaviate URL and API key."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    weaviate_url = os.getenv('WEAVIATE_URL')
+    weaviate_api_key = os.getenv('WEAVIATE_API_KEY')
+    groq_api_key = os.getenv("GROQ_API_KEY")
+    if groq_api_key:
+        os.environ["GROQ_API_KEY"] = groq_api_key
+    return weaviate_url, weaviate_api_key
+
+
+def get_embedding_model(model_name=EMBEDDING_MODEL_NAME):
+    """Build the embedding model once per process, even when called from several threads."""
+    model = _embedding_models.get(model_name)
+    if model is None:
+        with _embedding_lock:
+            model = _embedding_models.get(model_name)
+            if model is None:
+                model = _embedding_models[model_name] = _load_embedding_model(model_name)
+    return model
+
+
+def _load_embedding_model(model_name):
+    from langchain_huggingface.embeddings import HuggingFaceEmbeddings
+
+    logger.info(f"Loading embedding model: {model_name}")
+    return HuggingFaceEmbeddings(model_name=model_name)
 
 # @contextmanager
 def weaviate_client_context(url, api_key):
     """Context manager for Weaviate client."""
+    import weaviate
+    from weaviate.classes.init import Auth
+
     client = None
     client = weaviate.connect_to_weaviate_cloud(
         cluster_url=url,
@@ -48,15 +62,22 @@ def weaviate_client_context(url, api_key):
     
 def load_and_process_text(file_path):
     """Load and process text file."""
+    from pyvi import ViTokenizer
+
     try:
-        with open(file_path) as file:
-            transcript = file.read()
+        if file_path.endswith(".vts"):
+            from core.audio_pipeline.transcript_store import TranscriptStore
+
+            with TranscriptStore.open(file_path) as store:
+                transcript = store.full_text()
+        else:
+            with open(file_path) as file:
+                transcript = file.read()
         return ViTokenizer.tokenize(transcript)
     except Exception as e:
         print(f"Error loading file: {e}")
         return None
 
-@tool(response_format = "content_and_artifact")
 def retrieve(query: str, vector_store):
     """Retrieve information related to a query."""
     retrieved_docs = vector_store.similarity_search(query, k=2)
@@ -67,13 +88,28 @@ def retrieve(query: str, vector_store):
     return serialized, retrieved_docs
 
 
+@lru_cache(maxsize=None)
+def get_retrieve_tool():
+    """Wrap `retrieve` as a langchain tool on first use."""
+    from langchain_core.tools import tool
+
+    return tool(response_format = "content_and_artifact")(retrieve)
+
+
 
 def main():
+    import weaviate
+    from weaviate.classes.init import Auth
+    from langchain_groq import ChatGroq
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.runnables import RunnablePassthrough
+    from langchain_community.document_loaders import TextLoader
+    from langchain_weaviate.vectorstores import WeaviateVectorStore
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
     # Load environment variables
-    load_dotenv()
-    weaviate_url = os.getenv('WEAVIATE_URL')
-    weaviate_api_key = os.getenv('WEAVIATE_API_KEY')
-    os.environ["GROQ_API_KEY"] = os.getenv("GROQ_API_KEY")
+    weaviate_url, weaviate_api_key = load_config()
 
     # Process text
     # with open("../../data/transcription_Tra_An.txt") as f:
@@ -88,10 +124,7 @@ def main():
     logger.info(f"Documents: {texts}")
 
     # Initialize embedding model
-    embedding_model_name = "sentence-transformers/all-mpnet-base-v2"
-    embeddings = HuggingFaceEmbeddings(
-        model_name = embedding_model_name
-    )
+    embeddings = get_embedding_model()
 
     # Create vector store
     weaviate_client = weaviate.connect_to_weaviate_cloud(
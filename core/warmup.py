@@ -0,0 +1,25 @@
+from loguru import logger
+
+import time
+
+
+def warm_up(embeddings=True, asr=True):
+    """Preload the embedding and ASR models so the first request does not pay for it.
+
+    Safe to call more than once: the model getters are cached per process.
+    """
+    timings = {}
+    if embeddings:
+        from core.rag_pipeline.rag import get_embedding_model
+
+        start = time.perf_counter()
+        get_embedding_model()
+        timings["embeddings"] = time.perf_counter() - start
+    if asr:
+        from core.audio_pipeline.asr import get_whisper_model
+
+        start = time.perf_counter()
+        get_whisper_model()
+        timings["asr"] = time.perf_counter() - start
+    logger.info(f"Warm-up finished: {', '.join(f'{k}={v:.2f}s' for k, v in timings.items())}")
+    return timings
@@ -0,0 +1,60 @@
+"""Measure process start-up cost: module import time and model warm-up time.
+
+Each import is timed in a fresh interpreter so cached modules do not skew results.
+
+    python scripts/benchmark_startup.py --repeat 5
+    python scripts/benchmark_startup.py --warmup
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "core.rag_pipeline.rag",
+    "core.audio_pipeline.asr",
+    "core.warmup",
+]
+
+
+def time_import(module):
+    """Return the wall-clock seconds needed to import `module` in a new process."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--warmup", action="store_true", help="Also time loading the embedding and ASR models")
+    args = parser.parse_args()
+
+    for module in MODULES:
+        samples = [time_import(module) for _ in range(args.repeat)]
+        print(f"import {module:<28} median={statistics.median(samples) * 1000:8.1f} ms  "
+              f"min={min(samples) * 1000:8.1f} ms")
+
+    if args.warmup:
+        sys.path.insert(0, REPO_ROOT)
+        from core.warmup import warm_up
+
+        for name, seconds in warm_up().items():
+            print(f"warm-up {name:<29} {seconds:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
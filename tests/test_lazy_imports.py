@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_PACKAGES = [
+    "langchain",
+    "langchain_core",
+    "langchain_community",
+    "langchain_groq",
+    "langchain_huggingface",
+    "langchain_weaviate",
+    "langchain_text_splitters",
+    "weaviate",
+    "pyvi",
+    "dotenv",
+    "faster_whisper",
+    "whisper",
+    "sentence_transformers",
+    "torch",
+]
+
+
+@pytest.mark.parametrize("module", [
+    "core.rag_pipeline.rag",
+    "core.audio_pipeline.asr",
+    "core.warmup",
+])
+def test_import_pulls_in_no_heavy_packages(module):
+    code = (
+        "import sys; "
+        f"import {module}; "
+        "print('\\n'.join(sorted({name.split('.')[0] for name in sys.modules})))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(result.stdout.split())
+    assert not loaded & set(HEAVY_PACKAGES), f"{module} imported {sorted(loaded & set(HEAVY_PACKAGES))}"
@@ -0,0 +1,72 @@
+import sys
+import threading
+import time
+from types import ModuleType
+
+import pytest
+
+from core import warmup
+from core.audio_pipeline import asr
+from core.rag_pipeline import rag
+
+
+class FakeModel:
+    instances = 0
+
+    def __init__(self, **kwargs):
+        time.sleep(0.05)
+        type(self).instances += 1
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def fake_models(monkeypatch):
+    class FakeEmbeddings(FakeModel):
+        instances = 0
+
+    class FakeWhisper(FakeModel):
+        instances = 0
+
+    huggingface = ModuleType("langchain_huggingface")
+    huggingface_embeddings = ModuleType("langchain_huggingface.embeddings")
+    huggingface_embeddings.HuggingFaceEmbeddings = FakeEmbeddings
+    huggingface.embeddings = huggingface_embeddings
+    faster_whisper = ModuleType("faster_whisper")
+    faster_whisper.WhisperModel = FakeWhisper
+
+    monkeypatch.setitem(sys.modules, "langchain_huggingface", huggingface)
+    monkeypatch.setitem(sys.modules, "langchain_huggingface.embeddings", huggingface_embeddings)
+    monkeypatch.setitem(sys.modules, "faster_whisper", faster_whisper)
+    monkeypatch.setattr(rag, "_embedding_models", {})
+    monkeypatch.setattr(asr, "_whisper_models", {})
+    return FakeEmbeddings, FakeWhisper
+
+
+def test_default_and_explicit_arguments_share_model(fake_models):
+    FakeEmbeddings, FakeWhisper = fake_models
+    assert rag.get_embedding_model() is rag.get_embedding_model(rag.EMBEDDING_MODEL_NAME)
+    assert asr.get_whisper_model() is asr.get_whisper_model(asr.DEFAULT_WHISPER_MODEL_PATH, "cpu", "float32")
+    assert FakeEmbeddings.instances == 1
+    assert FakeWhisper.instances == 1
+
+
+@pytest.mark.parametrize("getter", [rag.get_embedding_model, asr.get_whisper_model])
+def test_concurrent_calls_load_model_once(fake_models, getter):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(getter())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 8
+    assert all(model is results[0] for model in results)
+    assert sum(cls.instances for cls in fake_models) == 1
+
+
+def test_warm_up_builds_each_model_once(fake_models):
+    FakeEmbeddings, FakeWhisper = fake_models
+    first = warmup.warm_up()
+    second = warmup.warm_up()
+    assert set(first) == set(second) == {"embeddings", "asr"}
+    assert FakeEmbeddings.instances == 1
+    assert FakeWhisper.instances == 1
@@ -1,22 +1,10 @@
-from faster_whisper import WhisperModel
-from dotenv import load_dotenv
+from core.audio_pipeline.asr import get_whisper_model
+from core.audio_pipeline.transcript_store import TranscriptStore
 from loguru import logger
 from tqdm import tqdm
 
-import whisper
-import os
-import time
-
 filepath = 'data/Tập 56 ｜ Án Trong Án - Kẻ Máu Lạnh Nhiều Tiền Tuyên Bố Diệt Cả Thẩm Phán - Tra Án Special.mp3'
 
-model = WhisperModel(
-    model_size_or_path='models/models--Systran--faster-whisper-small/snapshots/536b0662742c02347bc0e980a01041f333bce120',
-    device="cpu",
-    compute_type="float32",
-    download_root="models",
-    local_files_only=True
-)
-
 def transcribe_audio(audio_file, model):
     segments, info = model.transcribe(
         audio_file,
@@ -34,10 +22,14 @@ def transcribe_audio(audio_file, model):
             transcript += f"{segment.text}\n"
             pbar.set_postfix({"Time": f"{segment.start:.2f}s"})
     
-    return transcript
+    return transcript, segments_list
+
+if __name__ == "__main__":
+    model = get_whisper_model()
+    transcript, segments_list = transcribe_audio(audio_file=filepath, model=model)
+    logger.info(f"Transcript: {transcript}")
 
-transcript = transcribe_audio(audio_file=filepath, model=model)
-logger.info(f"Transcript: {transcript}")
+    with open("data/sample_transcript_Tra_an.txt", "w") as f:
+        f.write(transcript)
+    TranscriptStore.write("data/sample_transcript_Tra_an.vts", segments_list)
 
-with open("data/sample_transcript_Tra_an.txt", "w") as f:
-    f.write(transcript)
\ No newline at end of file
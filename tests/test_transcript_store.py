@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core.audio_pipeline.transcript_store import VERSION, TranscriptStore, parse_timestamp
+
+
+def make_segment(start, end, words):
+    words = [SimpleNamespace(start=s, end=e, word=w) for s, e, w in words]
+    return SimpleNamespace(start=start, end=end, text="".join(w.word for w in words), words=words)
+
+
+@pytest.fixture
+def store(tmp_path):
+    segments = [
+        make_segment(0.0, 2.0, [(0.0, 1.0, " Vụ"), (1.0, 2.0, " án")]),
+        make_segment(750.0, 760.0, [(750.0, 755.0, " xảy"), (755.0, 760.0, " ra")]),
+        make_segment(845.0, 850.0, [(845.0, 850.0, " ở đâu?")]),
+    ]
+    path = TranscriptStore.write(str(tmp_path / "transcript.vts"), segments)
+    with TranscriptStore.open(path) as store:
+        yield store
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("12:30") == 750.0
+    assert parse_timestamp("1:00:01.5") == 3601.5
+    assert parse_timestamp(42) == 42.0
+
+
+def test_round_trip(store):
+    assert len(store) == 3
+    assert store.n_words == 5
+    assert store.segment(1).text == " xảy ra"
+    assert store.words_of_segment(2)[0].text == " ở đâu?"
+    assert store.full_text() == " Vụ án\n xảy ra\n ở đâu?\n"
+
+
+def test_time_range_lookup(store):
+    assert store.text_between("12:30", "14:00") == " xảy ra\n"
+    assert store.text_between(0, float("inf")) == store.full_text()
+    assert [s.start for s in store.segments_between(1.5, 800)] == [0.0, 750.0]
+    assert store.text_between(3.0, 700.0) == ""
+    assert [w.text for w in store.words_between(752, 758)] == [" xảy", " ra"]
+    assert [w.text for w in store.words_around(752, 754, context=1)] == [" án", " xảy", " ra"]
+
+
+def test_rejects_unsorted_segments(tmp_path):
+    segments = [make_segment(5.0, 6.0, []), make_segment(1.0, 2.0, [])]
+    with pytest.raises(ValueError):
+        TranscriptStore.write(str(tmp_path / "bad.vts"), segments)
+
+
+def test_closed_interval_boundaries(tmp_path):
+    segments = [
+        make_segment(0.0, 2.0, [(0.0, 1.0, " a"), (1.0, 2.0, " b")]),
+        make_segment(2.0, 4.0, [(2.0, 4.0, " c")]),
+    ]
+    path = TranscriptStore.write(str(tmp_path / "boundary.vts"), segments)
+    with TranscriptStore.open(path) as store:
+        assert [s.start for s in store.segments_between(2.0, 2.0)] == [0.0, 2.0]
+        assert [w.text for w in store.words_between(1.0, 1.0)] == [" a", " b"]
+        assert store.text_between(4.0, 10.0) == " c\n"
+        assert store.text_between(4.5, 10.0) == ""
+
+
+@pytest.fixture
+def valid_bytes(tmp_path):
+    segments = [make_segment(0.0, 1.0, [(0.0, 1.0, " Vụ")])]
+    path = TranscriptStore.write(str(tmp_path / "valid.vts"), segments)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: b"",
+    lambda data: data[:20],
+    lambda data: data[:-20],
+    lambda data: data + b"\0",
+    lambda data: b"XXXX" + data[4:],
+    lambda data: data[:4] + (VERSION + 1).to_bytes(4, "little") + data[8:],
+], ids=["empty", "short-header", "truncated", "trailing-bytes", "bad-magic", "bad-version"])
+def test_rejects_invalid_files(tmp_path, valid_bytes, corrupt):
+    path = tmp_path / "corrupt.vts"
+    path.write_bytes(corrupt(valid_bytes))
+    with pytest.raises(ValueError):
+        TranscriptStore.open(str(path))
+
+
+def test_rejects_header_claiming_more_segments(tmp_path):
+    path = tmp_path / "lying.vts"
+    path.write_bytes(b"VTS1" + VERSION.to_bytes(4, "little") + (2).to_bytes(8, "little") + bytes(24))
+    with pytest.raises(ValueError):
+        TranscriptStore.open(str(path))
+
+
+def test_rejects_reversed_interval(store):
+    with pytest.raises(ValueError):
+        store.words_around(2.5, 0.5, context=1)
+    with pytest.raises(ValueError):
+        store.text_between("14:00", "12:30")
+
+
+def test_accepts_end_times_going_backwards(tmp_path):
+    segments = [
+        make_segment(0.0, 5.0, [(0.0, 5.0, " a")]),
+        make_segment(1.0, 2.0, [(1.0, 2.0, " b")]),
+        make_segment(3.0, 6.0, [(3.0, 6.0, " c")]),
+    ]
+    path = TranscriptStore.write(str(tmp_path / "vad.vts"), segments)
+    with TranscriptStore.open(path) as store:
+        assert [s.text for s in store.segments_between(4.0, 4.0)] == [" a", " c"]
+        assert [w.text for w in store.words_between(2.5, 2.5)] == [" a"]
+        assert store.text_between(0, 10) == store.full_text()